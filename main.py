@@ -1,75 +1,217 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 from PIL import Image, ImageTk
+import collections
+import concurrent.futures
 import requests
+from requests.adapters import HTTPAdapter, Retry
 import datetime
+import functools
+import io
 import os
 import threading
+import time
+import traceback
 import queue
+from pathlib import Path
+
+try:
+    import imageio
+except ImportError:
+    imageio = None  # optional; playback falls back to per-frame PNGs
+
+CACHE_MAX_AGE_DAYS = 7
+IMAGE_CACHE_SIZE = 64
+
+# Forecast hours per model, built once at import rather than per fetch.
+FORECAST_HOURS = {
+    "gfs": tuple(range(0, 241, 3)) + tuple(range(246, 385, 6)),
+    "ecmwf_full": tuple(range(0, 241, 3)) + tuple(range(246, 385, 6)),
+    "nam": tuple(range(0, 85)),
+    "hrrr": tuple(range(0, 49)),
+    "_default": tuple(range(0, 241, 6)),
+}
 
 def generate_forecast_hours(model):
-    """Generates a list of forecast hours based on the model's typical run schedule."""
-    if model in ['gfs', 'ecmwf_full']:
-        return list(range(0, 241, 3)) + list(range(246, 385, 6))
-    elif model == 'nam':
-        return list(range(0, 85, 1))
-    elif model == 'hrrr':
-        return list(range(0, 49, 1))
-    else:
-        return list(range(0, 241, 6))
+    """Returns the forecast hours for the model's typical run schedule."""
+    return FORECAST_HOURS.get(model, FORECAST_HOURS["_default"])
 
-def generate_run_times():
-    """Generates a dictionary of the last 8 model run times for the UI."""
+@functools.lru_cache(maxsize=1)
+def _run_times_for(now_utc):
+    """Builds the run-time dictionary for the given hour-bucketed UTC time."""
     run_times = {}
-    now_utc = datetime.datetime.utcnow()
     for i in range(8):
         run_time_to_check = now_utc - datetime.timedelta(hours=i * 6)
         run_hour = (run_time_to_check.hour // 6) * 6
-        dt_obj = run_time_to_check.replace(hour=run_hour, minute=0, second=0, microsecond=0)
-        display_text = dt_obj.strftime('%Y-%m-%d %HZ')
+        dt_obj = run_time_to_check.replace(hour=run_hour)
+        display_text = f"{dt_obj.year}-{dt_obj.month:02d}-{dt_obj.day:02d} {dt_obj.hour:02d}Z"
         if i == 0: display_text += " (Latest)"
-        run_time_str = dt_obj.strftime('%Y%m%d%H')
+        run_time_str = f"{dt_obj.year}{dt_obj.month:02d}{dt_obj.day:02d}{dt_obj.hour:02d}"
         run_times[display_text] = run_time_str
     return run_times
 
-def threaded_fetch_image_sequence(q, base_url, model, run_time, parameter, region, save_dir="weather_images"):
+def generate_run_times():
+    """Generates a dictionary of the last 8 model run times for the UI."""
+    now_utc = datetime.datetime.now(datetime.timezone.utc).replace(minute=0, second=0, microsecond=0)
+    return _run_times_for(now_utc)
+
+def purge_stale_cache(save_dir="weather_images", max_age_days=CACHE_MAX_AGE_DAYS):
+    """Deletes cached images older than max_age_days so the directory stays bounded."""
+    if not os.path.isdir(save_dir):
+        return
+    cutoff = time.time() - max_age_days * 86400
+    for name in os.listdir(save_dir):
+        path = os.path.join(save_dir, name)
+        try:
+            if os.path.isfile(path) and os.path.getmtime(path) < cutoff:
+                os.remove(path)
+        except OSError:
+            pass
+
+def _build_session():
+    """Builds a keep-alive session with connection pooling and small retries.
+
+    429 is retried honouring Retry-After so rate-limited frames are recovered
+    rather than dropped; raise_on_status is off so an exhausted 429 still comes
+    back as a response and can trigger the worker's adaptive throttle.
     """
-    This function runs in a separate thread to download images without freezing the GUI.
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32,
+                          max_retries=Retry(total=2, backoff_factor=0.3,
+                                            status_forcelist=[429, 502, 503, 504],
+                                            respect_retry_after_header=True,
+                                            raise_on_status=False))
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+def _probe_available(session, executor, urls_by_hour, cancel_event, limiter):
+    """Concurrently HEAD-probes the frame URLs and returns the hours that exist."""
+    def probe_one(hour):
+        if cancel_event.is_set():
+            return None
+        try:
+            with limiter:
+                response = session.head(urls_by_hour[hour], timeout=(3, 10))
+            # A rate-limited probe says nothing about the frame; assume it
+            # exists and let the GET path retry and throttle.
+            if response.status_code in (200, 429):
+                return hour
+        except requests.exceptions.RequestException:
+            pass
+        return None
+
+    return sorted(hour for hour in executor.map(probe_one, urls_by_hour) if hour is not None)
+
+def threaded_fetch_image_sequence(q, notify, session, executor, cancel_event, base_url, model, run_time, parameter, region, max_in_flight=8, save_dir=Path("weather_images")):
+    """
+    This function runs off the GUI thread to download images without freezing it.
+    Frames are fetched concurrently on the app's shared thread pool, over the
+    app's long-lived keep-alive session so TLS is only negotiated once per
+    connection. Availability is checked up front with cheap HEAD probes so only
+    frames that actually exist are downloaded. After each message is queued,
+    notify() is called to wake the GUI event loop. Setting cancel_event aborts
+    the fetch as soon as possible without posting a result.
     """
-    if not os.path.exists(save_dir):
-        os.makedirs(save_dir)
+    os.makedirs(save_dir, exist_ok=True)
+
+    def post(message):
+        q.put(message)
+        notify()
 
-    forecast_hours = generate_forecast_hours(model)
-    downloaded_paths = []
-    total_images = len(forecast_hours)
-    consecutive_failures = 0
+    # The executor is shared app-wide, so in-flight requests are bounded by a
+    # semaphore sized from the UI rather than by worker count.
+    limiter = threading.BoundedSemaphore(max_in_flight)
+    throttle = {"limit": max_in_flight, "lock": threading.Lock()}
 
-    for i, hour in enumerate(forecast_hours):
-        q.put({"type": "progress", "value": (i + 1) / total_images * 100})
+    def throttle_down():
+        # On HTTP 429, halve the in-flight budget (floor 1) by permanently
+        # holding back permits. Permits currently in use can't be grabbed
+        # non-blockingly, so a busy pool may shrink by less than half; further
+        # 429s will finish the job.
+        with throttle["lock"]:
+            target = max(1, throttle["limit"] // 2)
+            held = sum(1 for _ in range(throttle["limit"] - target) if limiter.acquire(blocking=False))
+            throttle["limit"] -= held
+            if held:
+                print(f"Rate limited; dropping to {throttle['limit']} concurrent downloads.")
+
+    # Only the forecast hour varies between frames; build the fixed pieces once.
+    url_prefix = f"{base_url}/maps/models/{model}/{run_time}/"
+    url_suffix = f"/{parameter}.{region}.png"
+    name_prefix = f"{model}_{run_time}_"
+    name_suffix = f"_{parameter}_{region}.png"
+    urls_by_hour = {}
+    paths_by_hour = {}
+    for hour in generate_forecast_hours(model):
         forecast_hour_str = f"{hour:03d}"
-        url = f"{base_url}/maps/models/{model}/{run_time}/{forecast_hour_str}/{parameter}.{region}.png"
-        file_path = os.path.join(save_dir, f"{model}_{run_time}_{forecast_hour_str}_{parameter}_{region}.png")
-        
+        urls_by_hour[hour] = url_prefix + forecast_hour_str + url_suffix
+        paths_by_hour[hour] = save_dir / (name_prefix + forecast_hour_str + name_suffix)
+
+    def fetch_one(hour):
+        if cancel_event.is_set():
+            return None
         try:
-            response = requests.get(url, stream=True)
+            with limiter:
+                response = session.get(urls_by_hour[hour], timeout=(3, 10))
+            if response.status_code == 429:
+                throttle_down()
             if response.status_code == 200:
-                consecutive_failures = 0
-                with open(file_path, 'wb') as f:
-                    f.write(response.content)
-                downloaded_paths.append(file_path)
-            else:
-                print(f"Skipping F{hour} for run {run_time}: Not found (status {response.status_code})")
-                consecutive_failures += 1
+                # Decode straight from the in-memory body, before writing, so a
+                # 200 carrying a non-PNG body (error page, truncated transfer)
+                # is skipped without poisoning the on-disk cache. The write sits
+                # under the same guard so a disk error (full, unwritable) is a
+                # skipped frame, not an exception out of the worker.
+                try:
+                    image = Image.open(io.BytesIO(response.content))
+                    image.load()
+                    paths_by_hour[hour].write_bytes(response.content)
+                except OSError as e:
+                    print(f"Skipping F{hour} for run {run_time}: {e}")
+                    return None
+                post({"type": "decoded", "path": paths_by_hour[hour], "image": image})
+                return paths_by_hour[hour]
+            print(f"Skipping F{hour} for run {run_time}: Not found (status {response.status_code})")
         except requests.exceptions.RequestException as e:
             print(f"Network error on F{hour}: {e}")
-            consecutive_failures += 1
-        
-        if consecutive_failures >= 3:
-            print("Stopping download: 3 consecutive frames were not found.")
-            q.put({"type": "progress", "value": 100})
-            break
+        return None
+
+    # Frames already on disk from an earlier fetch of this run need no network at all.
+    results = {hour: path for hour, path in paths_by_hour.items()
+               if os.path.exists(path) and os.path.getsize(path) > 0}
 
-    q.put({"type": "result", "run_time": run_time, "paths": downloaded_paths})
+    uncached = {hour: url for hour, url in urls_by_hour.items() if hour not in results}
+    available = _probe_available(session, executor, uncached, cancel_event, limiter)
+    if cancel_event.is_set():
+        return
+    if not available and not results:
+        print(f"No frames available for run {run_time}.")
+        post({"type": "progress", "value": 100})
+        post({"type": "result", "model": model, "run_time": run_time, "parameter": parameter,
+              "region": region, "hours": [], "paths": []})
+        return
+    total_images = len(available)
+    futures = {executor.submit(fetch_one, hour): hour for hour in available}
+    done = 0
+    for future in concurrent.futures.as_completed(futures):
+        if cancel_event.is_set():
+            for pending in futures:
+                pending.cancel()
+            return
+        done += 1
+        post({"type": "progress", "value": done / total_images * 100})
+        hour = futures[future]
+        path = future.result()
+        if path:
+            results[hour] = path
+
+    if cancel_event.is_set():
+        return
+    sorted_hours = sorted(results)
+    downloaded_paths = [results[hour] for hour in sorted_hours]
+    post({"type": "progress", "value": 100})
+    post({"type": "result", "model": model, "run_time": run_time, "parameter": parameter,
+          "region": region, "hours": sorted_hours, "paths": downloaded_paths})
     return
 
 class WeatherApp(tk.Tk):
@@ -126,17 +268,33 @@ class WeatherApp(tk.Tk):
         }
         
         # --- App State & UI Variables ---
+        self.save_dir = Path("weather_images")
+        purge_stale_cache(self.save_dir)
         self.run_times = generate_run_times()
         self.image_paths = []
         self.current_frame_index = 0
         self.model_run_time = None
+        self._run_dt_obj = None
+        self._hours = []
         self.is_playing = False
         self.animation_job = None
         self.fetch_queue = queue.Queue()
+        self.image_cache = collections.OrderedDict()
+        self._decoded_cache = collections.OrderedDict()
+        self._prefetching = set()
+        self._label_size = (0, 0)
+        self.video_reader = None
+        self._fetch_future = None
+        self._fetch_cancel = threading.Event()
+        self._prefetch_pool = concurrent.futures.ThreadPoolExecutor(max_workers=2, thread_name_prefix="decoder")
+        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=16, thread_name_prefix="fetcher")
+        self.http = _build_session()
+        self.protocol("WM_DELETE_WINDOW", self._shutdown)
         self.model_var = tk.StringVar(value="GFS")
         self.region_var = tk.StringVar(value="Continental US")
         self.param_var = tk.StringVar(value=list(self.parameters.keys())[0])
         self.run_time_var = tk.StringVar(value=list(self.run_times.keys())[0])
+        self.concurrency_var = tk.IntVar(value=8)
         
         # --- UI LAYOUT (No changes needed here) ---
         self.setup_ui()
@@ -157,10 +315,12 @@ class WeatherApp(tk.Tk):
         ttk.OptionMenu(control_frame, self.region_var, self.region_var.get(), *self.regions.keys()).grid(row=1, column=2, sticky="ew")
         ttk.Label(control_frame, text="Parameter:").grid(row=0, column=3, padx=5, pady=2, sticky="w")
         ttk.OptionMenu(control_frame, self.param_var, self.param_var.get(), *self.parameters.keys()).grid(row=1, column=3, sticky="ew")
+        ttk.Label(control_frame, text="Downloads:").grid(row=0, column=4, padx=5, pady=2, sticky="w")
+        ttk.Spinbox(control_frame, from_=1, to=32, textvariable=self.concurrency_var, width=4).grid(row=1, column=4, sticky="w")
         self.fetch_button = ttk.Button(control_frame, text="Fetch Sequence", command=self.start_fetch_thread)
-        self.fetch_button.grid(row=0, column=4, rowspan=2, padx=20, pady=5, sticky="ns")
+        self.fetch_button.grid(row=0, column=5, rowspan=2, padx=20, pady=5, sticky="ns")
         self.progress_bar = ttk.Progressbar(control_frame, orient='horizontal', mode='determinate')
-        self.progress_bar.grid(row=2, column=0, columnspan=5, sticky='ew', pady=(10,0))
+        self.progress_bar.grid(row=2, column=0, columnspan=6, sticky='ew', pady=(10,0))
         for i in range(4): control_frame.columnconfigure(i, weight=1)
         self.run_time_label = ttk.Label(self.info_frame, text="Model Run: --")
         self.run_time_label.pack(side="left", padx=10)
@@ -179,9 +339,16 @@ class WeatherApp(tk.Tk):
         self.image_label = ttk.Label(self.image_frame, text="Select parameters and click 'Fetch' to begin.", anchor="center")
         self.image_label.pack(fill="both", expand=True)
         self.tk_image = None
+        self.bind("<<FetchProgress>>", self._drain_queue)
+        self.image_label.bind("<Configure>", self._on_resize)
         
     def start_fetch_thread(self):
-        self.fetch_button.config(state="disabled")
+        # Abort any fetch still in flight so it stops competing for bandwidth.
+        self._abort_fetch()
+        self._fetch_cancel = threading.Event()
+        # The button doubles as Cancel while the fetch runs, so the user can
+        # preempt a download instead of waiting out up to 80 frames.
+        self.fetch_button.config(text="Cancel", command=self.cancel_fetch)
         self.progress_bar['value'] = 0
         self.set_animation_controls_state("disabled")
         self.image_label.config(image='', text="Please wait, fetching data...\nThis may take a moment.")
@@ -191,62 +358,218 @@ class WeatherApp(tk.Tk):
         base_url = self.base_urls[model_code]
         run_time_key = self.run_time_var.get()
         run_time_code = self.run_times[run_time_key]
+        try:
+            max_in_flight = max(1, min(32, self.concurrency_var.get()))
+        except tk.TclError:
+            max_in_flight = 8  # spinbox holds something non-numeric
+
+        self._fetch_future = self.executor.submit(
+            threaded_fetch_image_sequence,
+            self.fetch_queue, self._notify_fetch_progress, self.http, self.executor,
+            self._fetch_cancel, base_url, model_code, run_time_code,
+            self.parameters[self.param_var.get()],
+            self.regions[self.region_var.get()],
+            max_in_flight,
+            self.save_dir)
+        self._fetch_future.add_done_callback(self._on_fetch_done)
+
+    def _on_fetch_done(self, future):
+        # Runs on the worker thread. Without it, an unexpected exception in the
+        # worker would be swallowed by the executor and leave the UI waiting
+        # forever with no diagnostics.
+        if future.cancelled():
+            return
+        exc = future.exception()
+        if exc is None:
+            return
+        traceback.print_exception(type(exc), exc, exc.__traceback__)
+        if future is self._fetch_future:
+            # Post an empty result so the UI reports the failure and recovers.
+            self.fetch_queue.put({"type": "result", "run_time": None, "paths": [], "hours": []})
+            self._notify_fetch_progress()
+
+    def _abort_fetch(self):
+        self._fetch_cancel.set()
+        if self._fetch_future is not None:
+            self._fetch_future.cancel()
+
+    def cancel_fetch(self):
+        self._abort_fetch()
+        self.progress_bar['value'] = 0
+        self.fetch_button.config(text="Fetch Sequence", command=self.start_fetch_thread)
+        self.image_label.config(image='', text="Fetch cancelled.\nSelect parameters and click 'Fetch' to begin.")
 
-        self.thread = threading.Thread(
-            target=threaded_fetch_image_sequence,
-            args=(self.fetch_queue, base_url, model_code, run_time_code,
-                  self.parameters[self.param_var.get()],
-                  self.regions[self.region_var.get()])
-        )
-        self.thread.daemon = True
-        self.thread.start()
-        self.after(100, self.process_queue)
-
-    def process_queue(self):
+    def _shutdown(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        self._prefetch_pool.shutdown(wait=False, cancel_futures=True)
+        self.http.close()
+        self.destroy()
+
+    def _notify_fetch_progress(self):
+        # Called from the worker thread; event_generate is one of the few
+        # Tk calls that is safe off the main thread.
+        try:
+            self.event_generate("<<FetchProgress>>", when="tail")
+        except tk.TclError:
+            pass  # window is being torn down
+
+    def _drain_queue(self, event=None):
+        # Coalesce bursts: only the newest progress value and the final result
+        # matter, so apply each at most once per drain instead of per message.
+        latest_progress = None
+        result = None
         try:
-            message = self.fetch_queue.get_nowait()
-            if message["type"] == "progress":
-                self.progress_bar['value'] = message["value"]
-            elif message["type"] == "result":
-                self.handle_fetch_results(message["run_time"], message["paths"])
-                return
+            while True:
+                message = self.fetch_queue.get_nowait()
+                if message["type"] == "progress":
+                    latest_progress = message["value"]
+                elif message["type"] == "decoded":
+                    # PhotoImage creation has to happen on the GUI thread.
+                    self._cache_photo(message["path"], ImageTk.PhotoImage(self._fit_to_label(message["image"])))
+                elif message["type"] == "result":
+                    result = message
         except queue.Empty:
             pass
-        self.after(100, self.process_queue)
+        if latest_progress is not None:
+            self.progress_bar['value'] = latest_progress
+        if result is not None:
+            self.handle_fetch_results(result)
+
+    def _cache_photo(self, path, photo):
+        self.image_cache[path] = photo
+        self.image_cache.move_to_end(path)
+        while len(self.image_cache) > IMAGE_CACHE_SIZE:
+            self.image_cache.popitem(last=False)
+
+    def _fit_to_label(self, img):
+        """Scales the image down to the visible label size before Tk conversion."""
+        if img.mode not in ("RGB", "L"):
+            img = img.convert("RGB")  # dropping alpha is 25% less data per pixel
+        w, h = self._label_size
+        if w > 1 and h > 1 and (img.width > w or img.height > h):
+            scale = min(w / img.width, h / img.height)
+            new_size = (max(1, int(img.width * scale)), max(1, int(img.height * scale)))
+            # BILINEAR is ~3x faster than LANCZOS and indistinguishable on these maps.
+            img = img.resize(new_size, Image.Resampling.BILINEAR)
+        return img
+
+    def _on_resize(self, event):
+        if (event.width, event.height) == self._label_size:
+            return
+        self._label_size = (event.width, event.height)
+        # Cached frames are scaled to the old size; drop them and redraw.
+        self.image_cache.clear()
+        self._decoded_cache.clear()
+        if self.image_paths and self.current_frame_index >= 0:
+            self.display_frame(self.current_frame_index)
 
-    def handle_fetch_results(self, run_time, paths):
+    def _prefetch_frames(self, index):
+        """Keeps the next few frames decoded ahead of the animation tick."""
+        for ahead in range(index + 1, min(index + 5, len(self.image_paths))):
+            path = self.image_paths[ahead]
+            if path in self.image_cache or path in self._decoded_cache or path in self._prefetching:
+                continue
+            self._prefetching.add(path)
+            self._prefetch_pool.submit(self._decode_frame, path)
+
+    def _decode_frame(self, path):
+        try:
+            image = Image.open(path)
+            image.load()
+            self._decoded_cache[path] = self._fit_to_label(image)
+            while len(self._decoded_cache) > IMAGE_CACHE_SIZE:
+                self._decoded_cache.popitem(last=False)
+        except OSError:
+            pass
+        finally:
+            self._prefetching.discard(path)
+
+    def handle_fetch_results(self, result):
+        run_time, paths = result["run_time"], result["paths"]
         self.progress_bar['value'] = 0
+        if self.video_reader is not None:
+            self.video_reader.close()
+            self.video_reader = None
         if paths:
             self.model_run_time = run_time
             self.image_paths = paths
+            # Parse once here so display_frame never has to touch strptime. The
+            # hours come straight from the worker: re-parsing filenames breaks
+            # on model codes with underscores (ecmwf_full).
+            self._run_dt_obj = datetime.datetime.strptime(run_time, "%Y%m%d%H")
+            self._hours = result["hours"]
             self.current_frame_index = -1
             self.frame_slider.config(to=len(paths) - 1 if paths else 0)
             self.display_frame(0)
             self.set_animation_controls_state("normal")
             self.animation_frame.pack(side="top", fill="x", before=self.image_frame)
+            if imageio is not None:
+                self._prefetch_pool.submit(self._encode_video,
+                                           result["model"], run_time,
+                                           result["parameter"], result["region"],
+                                           list(paths))
         else:
             run_time_key = self.run_time_var.get()
             messagebox.showwarning("Download Failed", f"Could not download any images for the {run_time_key} run. The selected parameter may not be available for this model.")
             self.image_label.config(text="Select parameters and click 'Fetch' to begin.")
+
+        self.fetch_button.config(text="Fetch Sequence", command=self.start_fetch_thread)
         
-        self.fetch_button.config(state="normal")
-        
+    def _encode_video(self, model, run_time, parameter, region, paths):
+        """Packs the fetched sequence into one MP4 so playback reads a single file.
+
+        The source PNGs are kept: they double as the on-disk cache that lets a
+        re-fetch of the same run skip the network entirely.
+        """
+        out_path = self.save_dir / f"{model}_{run_time}_{parameter}_{region}.mp4"
+        try:
+            reader = None
+            if out_path.exists():
+                reader = imageio.get_reader(out_path)
+                if reader.count_frames() != len(paths):
+                    # Leftover from a partial fetch; its frame indices would not
+                    # line up with image_paths, so re-encode from scratch.
+                    reader.close()
+                    reader = None
+                    out_path.unlink()
+            if reader is None:
+                imageio.mimsave(out_path, [imageio.imread(p) for p in paths], fps=5)
+                reader = imageio.get_reader(out_path)
+        except Exception as e:
+            print(f"Video encode failed, staying in PNG mode: {e}")
+            return
+        if self.image_paths == paths:  # still showing this sequence
+            self.video_reader = reader
+        else:
+            reader.close()
+
     def display_frame(self, index):
         if not self.image_paths or not (0 <= index < len(self.image_paths)): return
         self.current_frame_index = index
         if int(self.frame_slider.get()) != index: self.frame_slider.set(index)
         filepath = self.image_paths[index]
         try:
-            img = Image.open(filepath)
-            self.tk_image = ImageTk.PhotoImage(img)
+            photo = self.image_cache.get(filepath)
+            if photo is None:
+                img = self._decoded_cache.pop(filepath, None)
+                if img is None and self.video_reader is not None:
+                    try:
+                        img = Image.fromarray(self.video_reader.get_data(index))
+                    except (IndexError, OSError):
+                        img = None
+                if img is None:
+                    img = Image.open(filepath)
+                photo = ImageTk.PhotoImage(self._fit_to_label(img))
+                self._cache_photo(filepath, photo)
+            else:
+                self.image_cache.move_to_end(filepath)
+            self.tk_image = photo
             self.image_label.config(image=self.tk_image)
-            filename = os.path.basename(filepath)
-            parts = filename.split('_')
-            hour_str = parts[2]
-            run_dt_obj = datetime.datetime.strptime(self.model_run_time, "%Y%m%d%H")
-            valid_dt_obj = run_dt_obj + datetime.timedelta(hours=int(hour_str))
-            self.run_time_label.config(text=f"Model Run: {run_dt_obj.strftime('%Y-%m-%d %H:%M')}Z")
-            self.forecast_hour_label.config(text=f"Forecast Hour: F{hour_str}")
+            self._prefetch_frames(index)
+            hour = self._hours[index]
+            valid_dt_obj = self._run_dt_obj + datetime.timedelta(hours=hour)
+            self.run_time_label.config(text=f"Model Run: {self._run_dt_obj.strftime('%Y-%m-%d %H:%M')}Z")
+            self.forecast_hour_label.config(text=f"Forecast Hour: F{hour:03d}")
             self.valid_time_label.config(text=f"Valid Time: {valid_dt_obj.strftime('%Y-%m-%d %H:%M')}Z")
         except Exception as e:
             self.image_label.config(image='', text=f"Error displaying image:\n{filepath}\n{e}")